@@ -21,111 +21,480 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-import re
-import requests
-from typing import List, Dict
+import functools
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterable, Iterator
 import os
+import sys
 import dns.resolver
 from dns.exception import DNSException
 import argparse
+import asyncio
+import concurrent.futures
 import csv
-from tqdm import tqdm
+import json
+import shutil
+import subprocess
+import tempfile
+
+try:
+    from tqdm import tqdm
+except ImportError:  # progress bars are a nicety: degrade to plain iteration
+    def tqdm(iterable=None, **kwargs):
+        return iterable
+
+try:
+    import dns.asyncresolver
+    HAS_ASYNC_RESOLVER = True
+except ImportError:  # dnspython < 2.0: fall back to the threaded path
+    HAS_ASYNC_RESOLVER = False
+
+try:
+    import aiodns  # optional: c-ares backend, much higher QPS than dnspython
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
 
 DISPOSABLE_DOMAINS: set[str] = set()
+# Reversed-label trie over DISPOSABLE_DOMAINS so subdomains of blocked domains
+# (e.g. foo.mailinator.com) are caught too; '' marks the end of a blocked entry.
+DISPOSABLE_TRIE: dict = {}
+
+def _build_disposable_trie(domains: set[str]) -> dict:
+    trie: dict = {}
+    for domain in domains:
+        node = trie
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        node[''] = True
+    return trie
+
+# The format accepted is ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$,
+# checked without a regex engine: the allowed-character classes are fixed, so
+# each part is scanned with a str.translate deletion table built once at
+# import — a single C loop per part, with an optional Hyperscan fast path.
+_EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+_ALPHANUM = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+# Deleting every allowed char leaves the empty string iff the part is clean
+_DEL_LOCAL = str.maketrans('', '', _ALPHANUM + '._%+-')
+_DEL_DOMAIN = str.maketrans('', '', _ALPHANUM + '.-')
+
+def _format_ok(s: str) -> bool:
+    """Translate-table equivalent of _EMAIL_PATTERN (no regex, no backtracking)."""
+    at = s.find('@')
+    if at < 1 or s.find('@', at + 1) != -1:
+        return False
+    local = s[:at]
+    domain = s[at + 1:]
+    if local.translate(_DEL_LOCAL):
+        return False
+    if domain.translate(_DEL_DOMAIN):
+        return False
+    dot = domain.rfind('.')
+    if dot < 1:  # need at least one domain char before the last dot
+        return False
+    tld = domain[dot + 1:]
+    return len(tld) >= 2 and tld.isalpha()
+
+try:
+    import hyperscan
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(expressions=[_EMAIL_PATTERN.encode()],
+                   flags=[hyperscan.HS_FLAG_SINGLEMATCH])
+
+    def _format_ok_hs(s: str) -> bool:
+        matched = []
+        _HS_DB.scan(s.encode('ascii', 'replace'),
+                    match_event_handler=lambda *a: matched.append(1))
+        return bool(matched)
+except ImportError:
+    _format_ok_hs = None
 
 def load_disposable_domains():
-    global DISPOSABLE_DOMAINS
+    global DISPOSABLE_DOMAINS, DISPOSABLE_TRIE
     file_path = 'disposable_email_blocklist.conf'
     if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                domain = line.strip().lower()
-                if domain and not domain.startswith('#'):
-                    DISPOSABLE_DOMAINS.add(domain)
+        # Read and case-fold the whole file in one C-level pass instead of
+        # strip/lower/startswith per line
+        with open(file_path, 'rb') as f:
+            data = f.read().lower().decode('ascii', 'ignore')
+        DISPOSABLE_DOMAINS = {domain for line in data.split('\n')
+                              if (domain := line.strip()) and not domain.startswith('#')}
+        DISPOSABLE_TRIE = _build_disposable_trie(DISPOSABLE_DOMAINS)
         print(f"Loaded {len(DISPOSABLE_DOMAINS)} disposable domains from local list")
     else:
-        print("Warning: File not found, fallback to API")
+        print("Warning: File not found, disposable check disabled")
 
 load_disposable_domains()
 
 def is_valid_email_format(email: str) -> bool:
-    """Check basic email format using regex."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    """Check basic email format: cheap string pre-filters, then the regex.
+
+    The O(1) checks (length, exactly one '@', a dot in the domain) reject
+    nearly all malformed input before the regex engine ever runs.
+    """
+    n = len(email)
+    if n < 5 or n > 254:
+        return False
+    at = email.find('@')
+    if at < 1 or email.find('@', at + 1) != -1:
+        return False
+    dot = email.rfind('.')
+    if dot < at + 2 or n - dot < 3:
+        return False
+    if _format_ok_hs is not None:
+        return _format_ok_hs(email)
+    return _format_ok(email)
 
 def is_disposable_email(email: str) -> bool:
-    """Check if email domain is disposable: local list first (fast/offline), then API fallback."""
-    domain = email.split('@')[-1].lower()
-    
-    if domain in DISPOSABLE_DOMAINS:  
+    """Check if email domain is disposable (convenience wrapper around is_disposable_domain)."""
+    return is_disposable_domain(email.split('@')[-1].lower())
+
+def is_disposable_domain(domain: str) -> bool:
+    """Check if a (lowercased) domain is disposable per the local blocklist."""
+    if domain in DISPOSABLE_DOMAINS:  # exact match: O(1) set lookup
         return True
-    
-  #   API fallback only if local missed it
-  #  try:
-  #      response = requests.get(f"https://api.mailchecker.net/v1/check?email={email}", timeout=5)
-  #      if response.status_code == 200:
-  #          data = response.json()
-  #          return data.get('disposable', False)
-  #   except Exception as e:
-  #      print(f"API disposable check failed for {email}: {e} (local list used only)")
-    
+
+    # Walk the reversed-label trie so subdomains of blocked domains match too
+    node = DISPOSABLE_TRIE
+    for label in reversed(domain.split('.')):
+        node = node.get(label)
+        if node is None:
+            break
+        if '' in node:
+            return True
+
     return False
 
+# One shared resolver for all sync lookups: the default per-call path re-reads
+# /etc/resolv.conf and waits up to 5 s per query. Aggressive timeouts bound the
+# worst case under a degraded resolver, and the LRU cache deduplicates repeat
+# queries at the resolver layer.
+_RESOLVER = dns.resolver.Resolver()
+_RESOLVER.timeout = 2.0
+_RESOLVER.lifetime = 3.0
+_RESOLVER.cache = dns.resolver.LRUCache(10000)
+_RESOLVER.nameservers = ['1.1.1.1', '8.8.8.8']
+
+@functools.lru_cache(maxsize=None)
 def has_mx_record(domain: str) -> bool:
-    """Check if the domain has at least one valid MX record (mail server exists)."""
+    """Check if the domain can receive mail (MX record, or A/AAAA fallback).
+
+    RFC 5321 section 5.1: when a domain has no MX record, receivers must fall
+    back to its A/AAAA address — many legitimate self-hosted domains publish
+    no MX at all. Results (including negative ones) are memoized per domain,
+    so a list full of @gmail.com addresses costs a single DNS query instead
+    of one per email.
+    """
     try:
-        answers = dns.resolver.resolve(domain, 'MX')
+        answers = _RESOLVER.resolve(domain, 'MX')
         return len(answers) > 0
-    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout, DNSException):
+    except dns.resolver.NXDOMAIN:
+        return False
+    except dns.resolver.NoAnswer:
+        pass  # no MX: fall through to the A/AAAA fallback
+    except (dns.resolver.Timeout, DNSException):
         return False
+    for record_type in ('A', 'AAAA'):
+        try:
+            if len(_RESOLVER.resolve(domain, record_type)) > 0:
+                return True
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout, DNSException):
+            continue
+    return False
+
+CSV_FIELDS = ['email', 'valid_format', 'disposable', 'mx_valid', 'status']
+
+@dataclass
+class Results:
+    """Columnar (structure-of-arrays) validation results.
+
+    Row i across all five columns describes one email. Columns of primitives
+    cost ~8 bytes per entry versus ~232 bytes of dict overhead per row, which
+    matters once inputs reach hundreds of thousands of emails.
+    """
+    email: List[str] = field(default_factory=list)
+    valid_format: List[bool] = field(default_factory=list)
+    disposable: List[bool] = field(default_factory=list)
+    mx_valid: List[bool] = field(default_factory=list)
+    status: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.email)
+
+    def append(self, email: str, valid_format: bool, disposable: bool,
+               mx_valid: bool, status: str) -> None:
+        self.email.append(email)
+        self.valid_format.append(valid_format)
+        self.disposable.append(disposable)
+        self.mx_valid.append(mx_valid)
+        self.status.append(status)
+
+    def rows(self) -> Iterator[tuple]:
+        """Iterate results row-wise as (email, valid_format, disposable, mx_valid, status)."""
+        return zip(self.email, self.valid_format, self.disposable,
+                   self.mx_valid, self.status)
+
+def _classify(email: str) -> tuple:
+    """CPU-only classification of one normalized email:
+    (valid_format, is_disposable, domain-or-None).
+
+    The domain is sliced out exactly once and handed to both the disposable
+    check and (by the caller) the MX lookup, instead of re-splitting the email
+    at each step. The whole non-DNS inner loop lives in this one function so a
+    compiled drop-in (Cython/mypyc) could replace it wholesale if format
+    checking ever dominates profiles once DNS is parallelized and cached.
+    """
+    if not is_valid_email_format(email):
+        return False, False, None
+    # Intern the domain: thousands of emails share a handful of domains, and
+    # interning makes the later set/dict lookups identity-compare hits
+    domain = sys.intern(email[email.rfind('@') + 1:])
+    return True, is_disposable_domain(domain), domain
+
+def _precheck_emails(emails: Iterable[str]) -> list:
+    """Run the cheap CPU-only checks (format + disposable) over all emails.
+
+    Returns (email, valid_format, is_disposable, domain-or-None) tuples; the
+    domain is set only for emails that still need an MX lookup.
+    """
+    classify = _classify
+    prechecked = []
+    for email in emails:
+        email = email.strip().lower()
+        if not email:
+            continue
+        valid_format, is_disposable, domain = classify(email)
+        prechecked.append((email, valid_format, is_disposable,
+                           None if is_disposable else domain))
+    return prechecked
+
+def _collect_results(prechecked: list, mx_by_domain: Dict[str, bool]) -> Results:
+    """Join resolved MX answers back onto the prechecked emails."""
+    results = Results()
+    for email, valid_format, is_disposable, domain in prechecked:
+        mx_valid = mx_by_domain.get(domain, False) if domain else False
+        if not valid_format:
+            status = 'Invalid format'
+        elif is_disposable:
+            status = 'Disposable'
+        elif mx_valid:
+            status = 'Valid'
+        else:
+            status = 'No MX record (domain invalid)'
+        results.append(email, valid_format, is_disposable, mx_valid, status)
+    return results
+
+async def ahas_mx_record_aiodns(domain: str, resolver) -> bool:
+    """Async MX check via aiodns (c-ares), with the same A/AAAA fallback as
+    the other backends. C-level networking, 10K+ QPS."""
+    try:
+        answers = await resolver.query(domain, 'MX')
+        return len(answers) > 0
+    except aiodns.error.DNSError:
+        pass  # no MX (or NXDOMAIN): fall through to the A/AAAA fallback
+    for record_type in ('A', 'AAAA'):
+        try:
+            if await resolver.query(domain, record_type):
+                return True
+        except aiodns.error.DNSError:
+            continue
+    return False
+
+def _zdns_pass(domains: List[str], record_type: str) -> set:
+    """Run one bulk zdns pass, returning the domains that had answers."""
+    answered = set()
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write('\n'.join(domains))
+        input_path = f.name
+    try:
+        proc = subprocess.run(
+            ['zdns', record_type, '--input-file', input_path],
+            capture_output=True, text=True, check=True)
+        for line in proc.stdout.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            name = record.get('name', '').lower()
+            answers = (record.get('data') or {}).get('answers') or []
+            if record.get('status') == 'NOERROR' and answers:
+                answered.add(name)
+    finally:
+        os.unlink(input_path)
+    return answered
+
+def resolve_mx_zdns(domains: List[str]) -> Dict[str, bool]:
+    """Resolve mail hosts for many domains by shelling out to the zdns bulk scanner.
+
+    Runs one `zdns MX` pass over all domains, then A and AAAA passes over
+    whatever is still unanswered — the same RFC 5321 fallback as the other
+    backends. Amortizes away per-query Python overhead entirely for very
+    large inputs; requires the zdns binary on PATH.
+    """
+    mx_by_domain = {d: False for d in domains}
+    for record_type in ('MX', 'A', 'AAAA'):
+        pending = [d for d, ok in mx_by_domain.items() if not ok]
+        if not pending:
+            break
+        for name in _zdns_pass(pending, record_type):
+            if name in mx_by_domain:
+                mx_by_domain[name] = True
+    return mx_by_domain
+
+async def ahas_mx_record(domain: str, resolver) -> bool:
+    """Async variant of has_mx_record (dns.asyncresolver), with A/AAAA fallback."""
+    try:
+        answers = await resolver.resolve(domain, 'MX')
+        return len(answers) > 0
+    except dns.resolver.NXDOMAIN:
+        return False
+    except dns.resolver.NoAnswer:
+        pass  # no MX: fall through to the A/AAAA fallback
+    except (dns.resolver.Timeout, DNSException):
+        return False
+    for record_type in ('A', 'AAAA'):
+        try:
+            if len(await resolver.resolve(domain, record_type)) > 0:
+                return True
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout, DNSException):
+            continue
+    return False
+
+async def avalidate_emails(emails: Iterable[str], concurrency: int = 512,
+                           show_progress: bool = False,
+                           backend: str = 'dnspython') -> Results:
+    """Async counterpart of validate_emails_parallel.
+
+    Unique domains are resolved concurrently on the event loop, capped by a
+    semaphore; this scales to far more in-flight queries than threads at a
+    fraction of the memory cost. With backend='aiodns', queries are driven by
+    c-ares instead of dnspython's pure-Python resolver (and the concurrency
+    cap can safely be raised).
+    """
+    prechecked = _precheck_emails(emails)
+
+    unique_domains = sorted({d for _, _, _, d in prechecked if d})
+    mx_by_domain: Dict[str, bool] = {}
+    if unique_domains:
+        if backend == 'aiodns':
+            resolver = aiodns.DNSResolver()
+            check_one = ahas_mx_record_aiodns
+        else:
+            resolver = dns.asyncresolver.Resolver()
+            check_one = ahas_mx_record
+        semaphore = asyncio.Semaphore(concurrency)
+        progress = tqdm(total=len(unique_domains), desc="Resolving MX",
+                        unit="domain") if show_progress else None
+
+        async def resolve_one(domain: str) -> bool:
+            async with semaphore:
+                ok = await check_one(domain, resolver)
+            if progress is not None:
+                progress.update(1)
+            return ok
+
+        answers = await asyncio.gather(*(resolve_one(d) for d in unique_domains))
+        if progress is not None:
+            progress.close()
+        mx_by_domain = dict(zip(unique_domains, answers))
+
+    return _collect_results(prechecked, mx_by_domain)
+
+def iter_validate(emails) -> Iterator[Dict[str, any]]:
+    """Validate emails one by one, yielding a result dict per email.
 
-def validate_emails(emails: List[str]) -> List[Dict[str, any]]:
-    """Validate a list of emails and return a list of result dictionaries.
-    
     Each result includes: email, valid_format, disposable, mx_valid, status.
     """
-    results = []
+    # Hoist hot-loop callables to locals (LOAD_FAST instead of LOAD_GLOBAL)
+    classify = _classify
+    check_mx = has_mx_record
+
     for email in emails:
         email = email.strip().lower()
         if not email:
             continue
-            
-        valid_format = is_valid_email_format(email)
-        is_disposable = False
+
+        valid_format, is_disposable, domain = classify(email)
         mx_valid = False
         status = 'Invalid format'
-        
+
         if valid_format:
-            is_disposable = is_disposable_email(email)
             if is_disposable:
                 status = 'Disposable'
             else:
-                domain = email.split('@')[-1]
-                mx_valid = has_mx_record(domain)
+                mx_valid = check_mx(domain)
                 if mx_valid:
                     status = 'Valid'
                 else:
                     status = 'No MX record (domain invalid)'
-        
-        results.append({
+
+        yield {
             'email': email,
             'valid_format': valid_format,
             'disposable': is_disposable,
-            'mx_valid': mx_valid,          
+            'mx_valid': mx_valid,
             'status': status
-        })
-    
+        }
+
+def validate_emails(emails: List[str]) -> Results:
+    """Validate a list of emails and return columnar Results."""
+    results = Results()
+    for r in iter_validate(emails):
+        results.append(r['email'], r['valid_format'], r['disposable'],
+                       r['mx_valid'], r['status'])
     return results
 
+def validate_emails_parallel(emails: Iterable[str], max_workers: int = 64,
+                             show_progress: bool = False) -> Results:
+    """Validate emails with MX lookups fanned out over a thread pool.
+
+    Phase 1 runs the cheap CPU checks (format + disposable) serially; phase 2
+    resolves only the unique domains that survived, in parallel. DNS latency
+    dominates total runtime, so this is where the wall-clock time goes.
+    """
+    prechecked = _precheck_emails(emails)
+
+    # Resolve each unique domain exactly once, in parallel
+    unique_domains = sorted({d for _, _, _, d in prechecked if d})
+    mx_by_domain: Dict[str, bool] = {}
+    if unique_domains:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            answers = executor.map(has_mx_record, unique_domains)
+            if show_progress:
+                answers = tqdm(answers, total=len(unique_domains),
+                               desc="Resolving MX", unit="domain")
+            mx_by_domain = dict(zip(unique_domains, answers))
+
+    return _collect_results(prechecked, mx_by_domain)
+
+def validate_emails_zdns(emails: Iterable[str]) -> Results:
+    """Validate emails using the external zdns bulk scanner for the MX phase."""
+    prechecked = _precheck_emails(emails)
+    unique_domains = sorted({d for _, _, _, d in prechecked if d})
+    mx_by_domain = resolve_mx_zdns(unique_domains) if unique_domains else {}
+    return _collect_results(prechecked, mx_by_domain)
+
+def iter_emails(input_file: str) -> Iterator[str]:
+    """Stream one email per line from a text file, strip whitespace, skip empties.
+
+    Generator form so million-line inputs never sit in memory as a list.
+    """
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            email = line.strip()
+            if email:  # skip empty lines
+                yield email
+
+def count_emails_in_file(input_file: str) -> int:
+    """Cheap binary pass to count non-empty lines (for progress totals)."""
+    with open(input_file, 'rb') as f:
+        return sum(1 for line in f if line.strip())
+
 def read_emails_from_file(input_file: str) -> list[str]:
     """Read one email per line from a text file, strip whitespace, skip empties."""
-    emails = []
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                email = line.strip()
-                if email:  # skip empty lines
-                    emails.append(email)
+        emails = list(iter_emails(input_file))
         print(f"Read {len(emails)} emails from {input_file}")
         return emails
     except FileNotFoundError:
@@ -135,19 +504,19 @@ def read_emails_from_file(input_file: str) -> list[str]:
         print(f"Error reading file: {e}")
         return []
 
-def save_results_to_csv(results: list[dict], output_file: str) -> None:
+def save_results_to_csv(results: Results, output_file: str) -> None:
     """Save validation results to CSV with all columns."""
     if not results:
         print("No results to save.")
         return
-    
-    fieldnames = ['email', 'valid_format', 'disposable', 'mx_valid', 'status']
-    
+
     try:
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
+            # csv.writer over preformed tuples skips DictWriter's per-row
+            # dict-to-list conversion
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(results.rows())
         print(f"Results saved to {output_file} ({len(results)} emails processed)")
     except Exception as e:
         print(f"Error saving CSV: {e}")
@@ -184,53 +553,105 @@ For questions or updates: check the GitHub repo (coming soon).
                         help="Input text file with one email per line")
     parser.add_argument('--output', type=str, default='validated_emails.csv',
                         help="Output CSV file (default: validated_emails.csv)")
+    parser.add_argument('--workers', type=int, default=64,
+                        help="Thread pool size for parallel MX lookups (default: 64)")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="Use asyncio + dns.asyncresolver for MX lookups "
+                             "(scales better than threads for very large lists)")
+    parser.add_argument('--backend', choices=['dnspython', 'aiodns', 'zdns'],
+                        default='dnspython',
+                        help="DNS backend for MX lookups: dnspython (default), "
+                             "aiodns (c-ares, implies --async), or zdns "
+                             "(external bulk scanner, needs zdns on PATH)")
     parser.add_argument('--verbose', action='store_true',
                         help="Print detailed per-email results to terminal (in addition to CSV)")
     parser.add_argument('--version', action='version', version='%(prog)s 1.0')
 
     args = parser.parse_args()
     
-    # Read emails from file
-    emails = read_emails_from_file(args.input)
-    if not emails:
+    # Stream emails from file: count first for the progress total, then feed
+    # the generator straight into validation (no full list in memory)
+    try:
+        total_emails = count_emails_in_file(args.input)
+    except FileNotFoundError:
+        print(f"Error: File '{args.input}' not found.")
+        exit(1)
+    if not total_emails:
         print("No emails to process. Exiting.")
         exit(1)
+    # Deduplicate up front (dict preserves first-seen order): duplicates are
+    # common in real lists and each one would otherwise pay the full
+    # format/disposable/MX cost again
+    unique_emails = dict.fromkeys(e.lower() for e in iter_emails(args.input))
+    print(f"Read {total_emails} emails from {args.input} "
+          f"({len(unique_emails)} unique)")
+    emails = unique_emails.keys()
     
     # Validate with progress bar
     print("Starting validation...")
-    results = []
-    for email in tqdm(emails, desc="Validating emails", unit="email"):
-        # We validate one at a time (you can later add batching if needed)
-        single_result_list = validate_emails([email])  # pass list of 1
-        results.extend(single_result_list)
-    
-    # Save to CSV
-    save_results_to_csv(results, args.output)
-    
+    # MX lookups are I/O-bound, so fan them out over a thread pool (default)
+    # or the asyncio event loop (--async) instead of resolving serially
+    if args.backend == 'zdns':
+        if shutil.which('zdns') is None:
+            print("Error: --backend zdns requires the zdns binary on PATH "
+                  "(https://github.com/zmap/zdns)")
+            exit(1)
+        results = validate_emails_zdns(emails)
+    elif args.backend == 'aiodns':
+        if not HAS_AIODNS:
+            print("Error: --backend aiodns requires the aiodns package "
+                  "(pip install aiodns)")
+            exit(1)
+        results = asyncio.run(avalidate_emails(emails, show_progress=True,
+                                               backend='aiodns'))
+    elif args.use_async and HAS_ASYNC_RESOLVER:
+        results = asyncio.run(avalidate_emails(emails, show_progress=True))
+    else:
+        if args.use_async:
+            print("Warning: dns.asyncresolver unavailable (dnspython < 2.0), "
+                  "using threaded lookups instead")
+        results = validate_emails_parallel(emails, max_workers=args.workers,
+                                           show_progress=True)
+
+    # Stream rows straight to the CSV in original file order, re-expanding
+    # duplicates by lookup; only the deduplicated results and a Counter stay
+    # in memory, never a full per-input-row list
+    row_by_email = {row[0]: row for row in results.rows()}
+    status_counts = Counter()
+    total_rows = 0
     if args.verbose:
         print("\nDetailed Results:")
         print("-" * 60)
-        for r in results:
-            print(f"Email: {r['email']}")
-            print(f"  Valid format   : {r['valid_format']}")
-            print(f"  Disposable     : {r['disposable']}")
-            print(f"  MX valid       : {r['mx_valid']}")
-            print(f"  Status         : {r['status']}")
-            print("-" * 60)
+    try:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            for email in iter_emails(args.input):
+                row = row_by_email[email.lower()]
+                writer.writerow(row)
+                status_counts[row[4]] += 1
+                total_rows += 1
+                if args.verbose:
+                    email, valid_format, disposable, mx_valid, status = row
+                    print(f"Email: {email}")
+                    print(f"  Valid format   : {valid_format}")
+                    print(f"  Disposable     : {disposable}")
+                    print(f"  MX valid       : {mx_valid}")
+                    print(f"  Status         : {status}")
+                    print("-" * 60)
+        print(f"Results saved to {args.output} ({total_rows} emails processed)")
+    except Exception as e:
+        print(f"Error saving CSV: {e}")
+        exit(1)
 
     # Optional: still print summary to terminal
     print("\n" + "=" * 50)
     print("Validation Summary")
     print("=" * 50)
-    print(f"Total emails processed: {len(results):,}")
-    
-    status_counts = {}
-    for r in results:
-        status = r['status']
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
+    print(f"Total emails processed: {total_rows:,}")
+
     for status, count in sorted(status_counts.items(), key=lambda x: x[1], reverse=True):
-        percentage = (count / len(results)) * 100 if results else 0
+        percentage = (count / total_rows) * 100 if total_rows else 0
         print(f"{status:<30} {count:>6} ({percentage:5.1f}%)")
-    
+
     print("=" * 50)
\ No newline at end of file